@@ -33,6 +33,7 @@
             deepdiff
             keyring
             mpv
+            orjson
             peewee
             PyChromecast
             pygobject3
@@ -13,6 +13,13 @@ import sublime_music
 
 from .app import SublimeMusicApp
 
+# Default to ~/.config/sublime-music/config.json. The user directory is only expanded
+# when the default is actually used, so that passing --config works even if the home
+# directory cannot be determined.
+DEFAULT_CONFIG_FILE = Path(
+    os.environ.get("XDG_CONFIG_HOME") or os.environ.get("APPDATA") or "~/.config"
+).joinpath("sublime-music", "config.json")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Sublime Music")
@@ -47,19 +54,6 @@ def main():
     )
 
     # Config File
-    config_file = args.config
-    if not config_file:
-        # Default to ~/.config/sublime-music.
-        config_file = (
-            Path(
-                os.environ.get("XDG_CONFIG_HOME")
-                or os.environ.get("APPDATA")
-                or os.path.join("~/.config")
-            )
-            .joinpath("sublime-music", "config.json")
-            .expanduser()
-            .resolve()
-        )
-
-    app = SublimeMusicApp(Path(config_file))
+    config_file = Path(args.config) if args.config else DEFAULT_CONFIG_FILE.expanduser()
+    app = SublimeMusicApp(config_file.resolve())
     app.run(unknown_args)
@@ -1,6 +1,7 @@
 """
 Defines the objects that are returned by adapter methods.
 """
+
 import abc
 import logging
 from datetime import datetime, timedelta
@@ -21,8 +22,19 @@ from typing import (
 
 from thefuzz import fuzz
 
+# Implementations of these classes provide the storage for the declared attributes (the
+# Subsonic ones are dataclasses with slots), so these classes declare empty slots to
+# avoid giving every instance a __dict__ as well.
+#
+# This is deliberately not the literal ``()``. mypy checks assignments against a literal
+# __slots__, so it would reject assigning any of the declared attributes through these
+# abstract types (for example ``song.user_rating = ...``). Keep it a named constant.
+_NO_SLOTS: Tuple[str, ...] = ()
+
 
 class Genre(abc.ABC):
+    __slots__ = _NO_SLOTS
+
     name: str
     song_count: Optional[int]
     album_count: Optional[int]
@@ -34,6 +46,8 @@ class Album(abc.ABC):
     (such as Subsonic) sends an album name, but not an album ID.
     """
 
+    __slots__ = _NO_SLOTS
+
     name: str
     id: Optional[str]
     artist: Optional["Artist"]
@@ -55,6 +69,8 @@ class Artist(abc.ABC):
     happens when there are multiple artists.
     """
 
+    __slots__ = _NO_SLOTS
+
     name: str
     id: Optional[str]
     album_count: Optional[int]
@@ -74,6 +90,8 @@ class Directory(abc.ABC):
     top-level directory.
     """
 
+    __slots__ = _NO_SLOTS
+
     id: str
     name: Optional[str]
     parent_id: Optional[str]
@@ -81,6 +99,8 @@ class Directory(abc.ABC):
 
 
 class Song(abc.ABC):
+    __slots__ = _NO_SLOTS
+
     id: str
     title: str
     path: Optional[str]
@@ -101,6 +121,8 @@ class Song(abc.ABC):
 
 
 class Playlist(abc.ABC):
+    __slots__ = _NO_SLOTS
+
     id: str
     name: str
     song_count: Optional[int]
@@ -115,6 +137,8 @@ class Playlist(abc.ABC):
 
 
 class PlayQueue(abc.ABC):
+    __slots__ = _NO_SLOTS
+
     songs: Sequence[Song]
     position: timedelta
     username: Optional[str]
@@ -3,6 +3,7 @@ import logging
 import shutil
 import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple, cast
 
@@ -432,7 +433,11 @@ class FilesystemAdapter(CachingAdapter):
 
     # Data Ingestion Methods
     # ==================================================================================
-    def _strhash(self, string: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _strhash(string: str) -> str:
+        # These hashes are persisted as synthetic IDs in the cache database, so they
+        # need to stay stable across runs and versions.
         return hashlib.sha1(bytes(string, "utf8")).hexdigest()
 
     def ingest_new_data(
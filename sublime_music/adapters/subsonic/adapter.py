@@ -1,5 +1,4 @@
 import hashlib
-import json
 import logging
 import math
 import multiprocessing
@@ -14,6 +13,7 @@ from time import sleep
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, cast
 from urllib.parse import urlencode, urlparse
 
+import orjson
 import requests
 import semver
 from gi.repository import Gtk
@@ -514,7 +514,7 @@ class SubsonicAdapter(Adapter):
             is_exponential_backoff_ping=is_exponential_backoff_ping,
             **params,
         )
-        subsonic_response = result.json().get("subsonic-response")
+        subsonic_response = orjson.loads(result.content).get("subsonic-response")
 
         if not subsonic_response:
             raise ServerError(500, f"{url} returned invalid JSON.")
@@ -529,7 +529,7 @@ class SubsonicAdapter(Adapter):
         self._version.value = subsonic_response["version"].encode()  # type: ignore
 
         logging.debug(f"Response from {url}: {subsonic_response}")
-        return Response.from_dict(subsonic_response)
+        return Response.from_api(subsonic_response)
 
     # Helper Methods for Testing
     _get_mock_data: Any = None
@@ -540,13 +540,7 @@ class SubsonicAdapter(Adapter):
             status_code = 200
 
             def __init__(self, content: Any):
-                self._content = content
-
-            def content(self) -> Any:
-                return self._content
-
-            def json(self) -> Any:
-                return json.loads(self._content)
+                self.content = content
 
         def get_mock_data() -> Any:
             if type(data) == Exception:
@@ -2,9 +2,10 @@
 These are the API objects that are returned by Subsonic.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, get_args
 
 import dataclasses_json
 from dataclasses_json import DataClassJsonMixin, LetterCase, config, dataclass_json
@@ -12,12 +13,46 @@ from dateutil import parser
 
 from .. import api_objects as SublimeAPI
 
+# DataClassJsonMixin has no __slots__, so listing it as a base would give every instance
+# of the slotted classes a __dict__. The @dataclass_json decorator adds the same methods
+# at runtime, but type checkers only know about them through the base class.
+if TYPE_CHECKING:
+    _JsonMixin = DataClassJsonMixin
+else:
+    _JsonMixin = object
+
+
+def _decode_datetime(s: Optional[str]) -> Optional[datetime]:
+    if not s:
+        return None
+    try:
+        # Subsonic servers send ISO 8601 timestamps, which fromisoformat parses far
+        # faster than dateutil. It only understands the "Z" suffix on Python 3.11+.
+        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        return parser.parse(s)
+
+
+def _decode_timedelta(s: Any) -> Optional[timedelta]:
+    return timedelta(seconds=float(s)) if s else None
+
+
+def _decode_int(s: Any) -> Optional[int]:
+    return int(s) if s else None
+
+
+def _intern(s: Optional[str]) -> Optional[str]:
+    # Artist, album, and genre names and IDs repeat across thousands of songs, so share
+    # a single copy of each string.
+    return sys.intern(s) if isinstance(s, str) else s
+
+
 # Translation map for encoding/decoding API results. For instance some servers
 # may return a string where an integer is required.
-decoder_functions = {
-    datetime: (lambda s: parser.parse(s) if s else None),
-    timedelta: (lambda s: timedelta(seconds=float(s)) if s else None),
-    int: (lambda s: int(s) if s else None),
+decoder_functions: Dict[type, Callable[[Any], Any]] = {
+    datetime: _decode_datetime,
+    timedelta: _decode_timedelta,
+    int: _decode_int,
 }
 encoder_functions = {
     datetime: (lambda d: datetime.strftime(d, "%Y-%m-%dT%H:%M:%S.%f%z") if d else None),
@@ -37,16 +72,59 @@ for type_, translation_function in encoder_functions.items():
     ] = translation_function
 
 
+# Songs, albums, artists, genres, and playlists are by far the most numerous objects in
+# Subsonic responses, so they (and directories, which can contain thousands of songs)
+# are decoded by the hand-written from_api constructors rather than by dataclasses_json.
+# These read the keys that Subsonic sends directly instead of translating them field by
+# field, and never look at the many keys that are not consumed (bitRate, suffix, etc.).
+#
+# The classes are passed by name because they refer to each other before they are all
+# defined (an album's songs, for instance).
+def _optional(class_name: str) -> Callable[[Optional[Dict[str, Any]]], Any]:
+    def decode(data: Optional[Dict[str, Any]]) -> Any:
+        return globals()[class_name].from_api(data) if data else None
+
+    return decode
+
+
+def _many(class_name: str) -> Callable[[Optional[List[Dict[str, Any]]]], List[Any]]:
+    def decode(data: Optional[List[Dict[str, Any]]]) -> List[Any]:
+        from_api = globals()[class_name].from_api
+        return [from_api(d) for d in data or ()]
+
+    return decode
+
+
+_decode_song = _optional("Song")
+_decode_songs = _many("Song")
+_decode_album = _optional("Album")
+_decode_albums = _many("Album")
+_decode_artist = _optional("ArtistAndArtistInfo")
+_decode_artists = _many("ArtistAndArtistInfo")
+_decode_genres = _many("Genre")
+_decode_playlist = _optional("Playlist")
+_decode_playlists = _many("Playlist")
+_decode_directory = _optional("Directory")
+
+
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class Genre(SublimeAPI.Genre):
     name: str = field(metadata=config(field_name="value"))
     song_count: Optional[int] = None
     album_count: Optional[int] = None
 
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Genre":
+        return cls(
+            name=data["value"],
+            song_count=_decode_int(data.get("songCount")),
+            album_count=_decode_int(data.get("albumCount")),
+        )
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class Album(SublimeAPI.Album):
     name: str
     id: Optional[str]
@@ -55,7 +133,9 @@ class Album(SublimeAPI.Album):
     year: Optional[int] = None
     duration: Optional[timedelta] = None
     created: Optional[datetime] = None
-    songs: List["Song"] = field(default_factory=list, metadata=config(field_name="song"))
+    songs: List["Song"] = field(
+        default_factory=list, metadata=config(field_name="song", decoder=_decode_songs)
+    )
     play_count: Optional[int] = None
     starred: Optional[datetime] = None
 
@@ -69,6 +149,10 @@ class Album(SublimeAPI.Album):
     _genre: Optional[str] = field(default=None, metadata=config(field_name="genre"))
 
     def __post_init__(self):
+        self.artist_id = _intern(self.artist_id)
+        self._artist = _intern(self._artist)
+        self._genre = _intern(self._genre)
+
         # Initialize the cross-references
         self.artist = (
             None
@@ -77,13 +161,33 @@ class Album(SublimeAPI.Album):
         )
         self.genre = None if not self._genre else Genre(self._genre)
 
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Album":
+        return cls(
+            name=data["name"],
+            id=data.get("id"),
+            cover_art=data.get("coverArt"),
+            song_count=_decode_int(data.get("songCount")),
+            year=_decode_int(data.get("year")),
+            duration=_decode_timedelta(data.get("duration")),
+            created=_decode_datetime(data.get("created")),
+            songs=_decode_songs(data.get("song")),
+            play_count=_decode_int(data.get("playCount")),
+            starred=_decode_datetime(data.get("starred")),
+            _artist=data.get("artist"),
+            artist_id=data.get("artistId"),
+            _genre=data.get("genre"),
+        )
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class ArtistAndArtistInfo(SublimeAPI.Artist):
     name: str
     id: Optional[str]
-    albums: List[Album] = field(default_factory=list, metadata=config(field_name="album"))
+    albums: List[Album] = field(
+        default_factory=list, metadata=config(field_name="album", decoder=_decode_albums)
+    )
     album_count: Optional[int] = None
     cover_art: Optional[str] = None
     artist_image_url: Optional[str] = None
@@ -101,6 +205,21 @@ class ArtistAndArtistInfo(SublimeAPI.Artist):
         if not self.artist_image_url:
             self.artist_image_url = self.cover_art
 
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "ArtistAndArtistInfo":
+        return cls(
+            name=data["name"],
+            id=data.get("id"),
+            albums=_decode_albums(data.get("album")),
+            album_count=_decode_int(data.get("albumCount")),
+            cover_art=data.get("coverArt"),
+            artist_image_url=data.get("artistImageUrl"),
+            starred=_decode_datetime(data.get("starred")),
+            biography=data.get("biography"),
+            music_brainz_id=data.get("musicBrainzId"),
+            last_fm_url=data.get("lastFmUrl"),
+        )
+
     def augment_with_artist_info(self, artist_info: Optional["ArtistInfo"]):
         if artist_info:
             self.similar_artists = artist_info.similar_artists
@@ -111,10 +230,11 @@ class ArtistAndArtistInfo(SublimeAPI.Artist):
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class ArtistInfo:
     similar_artists: List[ArtistAndArtistInfo] = field(
-        default_factory=list, metadata=config(field_name="similarArtist")
+        default_factory=list,
+        metadata=config(field_name="similarArtist", decoder=_decode_artists),
     )
     biography: Optional[str] = None
     last_fm_url: Optional[str] = None
@@ -136,8 +256,8 @@ class ArtistInfo:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class Directory(SublimeAPI.Directory, DataClassJsonMixin):
+@dataclass(slots=True)
+class Directory(SublimeAPI.Directory, _JsonMixin):
     id: str
     name: Optional[str] = None
     title: Optional[str] = None
@@ -155,13 +275,35 @@ class Directory(SublimeAPI.Directory, DataClassJsonMixin):
 
         self.name = self.name or self.title
         self.children = [
-            Directory.from_dict(c) if c.get("isDir") else Song.from_dict(c) for c in self._children
+            Directory.from_api(c) if c.get("isDir") else Song.from_api(c) for c in self._children
         ]
 
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Directory":
+        return cls(
+            id=data["id"],
+            name=data.get("name"),
+            title=data.get("title"),
+            parent_id=data.get("parent"),
+            _children=data.get("child") or [],
+        )
+
+
+class _SongReferences(SublimeAPI.Song):
+    # The artist, album, and genre cross-references are only needed once a song is
+    # actually displayed, so they are constructed on first access (see the properties on
+    # Song) rather than for every song in a response. They are slots on this base rather
+    # than dataclass fields so that asdict and to_dict only contain the decoded data.
+    __slots__ = ("_artist_ref", "_album_ref", "_genre_ref")
+
+    _artist_ref: Optional[ArtistAndArtistInfo]
+    _album_ref: Optional[Album]
+    _genre_ref: Optional[Genre]
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class Song(SublimeAPI.Song, DataClassJsonMixin):
+@dataclass(slots=True)
+class Song(_SongReferences, _JsonMixin):
     id: str
     title: str = field(metadata=config(field_name="name"))
     path: Optional[str] = None
@@ -169,17 +311,14 @@ class Song(SublimeAPI.Song, DataClassJsonMixin):
     duration: Optional[timedelta] = None
 
     # Artist
-    artist: Optional[ArtistAndArtistInfo] = field(init=False)
     _artist: Optional[str] = field(default=None, metadata=config(field_name="artist"))
     artist_id: Optional[str] = None
 
     # Album
-    album: Optional[Album] = field(init=False)
     _album: Optional[str] = field(default=None, metadata=config(field_name="album"))
     album_id: Optional[str] = None
 
     # Genre
-    genre: Optional[Genre] = field(init=False)
     _genre: Optional[str] = field(default=None, metadata=config(field_name="genre"))
 
     track: Optional[int] = None
@@ -194,19 +333,64 @@ class Song(SublimeAPI.Song, DataClassJsonMixin):
         if not isinstance(self.id, str):
             self.id = str(self.id)
         self.parent_id = (self.parent_id or "root") if self.id != "root" else None
-        self.artist = (
-            None if not self._artist else ArtistAndArtistInfo(id=self.artist_id, name=self._artist)
+        self._artist_ref = None
+        self._album_ref = None
+        self._genre_ref = None
+        self.artist_id = _intern(self.artist_id)
+        self._artist = _intern(self._artist)
+        self.album_id = _intern(self.album_id)
+        self._album = _intern(self._album)
+        self._genre = _intern(self._genre)
+
+    @property
+    def artist(self) -> Optional[ArtistAndArtistInfo]:  # type: ignore
+        if self._artist_ref is None and self._artist:
+            self._artist_ref = ArtistAndArtistInfo(id=self.artist_id, name=self._artist)
+        return self._artist_ref
+
+    @property
+    def album(self) -> Optional[Album]:  # type: ignore
+        if self._album_ref is None and self._album:
+            self._album_ref = Album(id=self.album_id, name=self._album)
+        return self._album_ref
+
+    @property
+    def genre(self) -> Optional[Genre]:  # type: ignore
+        if self._genre_ref is None and self._genre:
+            self._genre_ref = Genre(self._genre)
+        return self._genre_ref
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Song":
+        return cls(
+            id=data["id"],
+            title=data["title"] if "title" in data else data["name"],
+            path=data.get("path"),
+            parent_id=data.get("parent"),
+            duration=_decode_timedelta(data.get("duration")),
+            _artist=data.get("artist"),
+            artist_id=data.get("artistId"),
+            _album=data.get("album"),
+            album_id=data.get("albumId"),
+            _genre=data.get("genre"),
+            track=_decode_int(data.get("track")),
+            disc_number=_decode_int(data.get("discNumber")),
+            year=_decode_int(data.get("year")),
+            size=_decode_int(data.get("size")),
+            cover_art=data.get("coverArt"),
+            user_rating=_decode_int(data.get("userRating")),
+            starred=_decode_datetime(data.get("starred")),
         )
-        self.album = None if not self._album else Album(id=self.album_id, name=self._album)
-        self.genre = None if not self._genre else Genre(self._genre)
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class Playlist(SublimeAPI.Playlist):
     id: str
     name: str
-    songs: List[Song] = field(default_factory=list, metadata=config(field_name="entry"))
+    songs: List[Song] = field(
+        default_factory=list, metadata=config(field_name="entry", decoder=_decode_songs)
+    )
     song_count: Optional[int] = field(default=None)
     duration: Optional[timedelta] = field(default=None)
     created: Optional[datetime] = None
@@ -225,15 +409,31 @@ class Playlist(SublimeAPI.Playlist):
             self.song_count = len(self.songs)
 
         if self.duration is None:
-            self.duration = timedelta(
-                seconds=sum(s.duration.total_seconds() if s.duration else 0 for s in self.songs)
-            )
+            self.duration = sum((s.duration for s in self.songs if s.duration), timedelta(0))
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Playlist":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            songs=_decode_songs(data.get("entry")),
+            song_count=_decode_int(data.get("songCount")),
+            duration=_decode_timedelta(data.get("duration")),
+            created=_decode_datetime(data.get("created")),
+            changed=_decode_datetime(data.get("changed")),
+            comment=data.get("comment"),
+            owner=data.get("owner"),
+            public=data.get("public"),
+            cover_art=data.get("coverArt"),
+        )
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
+@dataclass(slots=True)
 class PlayQueue(SublimeAPI.PlayQueue):
-    songs: List[Song] = field(default_factory=list, metadata=config(field_name="entry"))
+    songs: List[Song] = field(
+        default_factory=list, metadata=config(field_name="entry", decoder=_decode_songs)
+    )
     position: timedelta = timedelta(0)
     username: Optional[str] = None
     changed: Optional[datetime] = None
@@ -248,7 +448,12 @@ class PlayQueue(SublimeAPI.PlayQueue):
             # because the Subsonic API is sometime stupid.
             self.position = pos / 1000
         if cur := self.current:
-            self.current_index = [s.id for s in self.songs].index(str(cur))
+            # Some servers send the current song ID as an integer.
+            cur = str(cur)
+            for i, song in enumerate(self.songs):
+                if song.id == cur:
+                    self.current_index = i
+                    break
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
@@ -262,7 +467,9 @@ class Index:
 @dataclass
 class IndexID3:
     name: str
-    artist: List[ArtistAndArtistInfo] = field(default_factory=list)
+    artist: List[ArtistAndArtistInfo] = field(
+        default_factory=list, metadata=config(decoder=_decode_artists)
+    )
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
@@ -275,13 +482,13 @@ class ArtistsID3:
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
 class AlbumList2:
-    album: List[Album] = field(default_factory=list)
+    album: List[Album] = field(default_factory=list, metadata=config(decoder=_decode_albums))
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
 class Genres:
-    genre: List[Genre] = field(default_factory=list)
+    genre: List[Genre] = field(default_factory=list, metadata=config(decoder=_decode_genres))
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
@@ -294,15 +501,19 @@ class Indexes:
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
 class Playlists:
-    playlist: List[Playlist] = field(default_factory=list)
+    playlist: List[Playlist] = field(
+        default_factory=list, metadata=config(decoder=_decode_playlists)
+    )
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
 class SearchResult3:
-    artist: List[ArtistAndArtistInfo] = field(default_factory=list)
-    album: List[Album] = field(default_factory=list)
-    song: List[Song] = field(default_factory=list)
+    artist: List[ArtistAndArtistInfo] = field(
+        default_factory=list, metadata=config(decoder=_decode_artists)
+    )
+    album: List[Album] = field(default_factory=list, metadata=config(decoder=_decode_albums))
+    song: List[Song] = field(default_factory=list, metadata=config(decoder=_decode_songs))
 
 
 @dataclass
@@ -310,27 +521,61 @@ class Response(DataClassJsonMixin):
     """The base Subsonic response object."""
 
     artists: Optional[ArtistsID3] = None
-    artist: Optional[ArtistAndArtistInfo] = None
+    artist: Optional[ArtistAndArtistInfo] = field(
+        default=None, metadata=config(decoder=_decode_artist)
+    )
     artist_info: Optional[ArtistInfo] = field(
         default=None, metadata=config(field_name="artistInfo2")
     )
 
     albums: Optional[AlbumList2] = field(default=None, metadata=config(field_name="albumList2"))
-    album: Optional[Album] = None
+    album: Optional[Album] = field(default=None, metadata=config(decoder=_decode_album))
 
-    directory: Optional[Directory] = None
+    directory: Optional[Directory] = field(
+        default=None, metadata=config(decoder=_decode_directory)
+    )
 
     genres: Optional[Genres] = None
 
     indexes: Optional[Indexes] = None
 
-    playlist: Optional[Playlist] = None
+    playlist: Optional[Playlist] = field(default=None, metadata=config(decoder=_decode_playlist))
     playlists: Optional[Playlists] = None
 
     play_queue: Optional[PlayQueue] = field(default=None, metadata=config(field_name="playQueue"))
 
-    song: Optional[Song] = None
+    song: Optional[Song] = field(default=None, metadata=config(decoder=_decode_song))
 
     search_result: Optional[SearchResult3] = field(
         default=None, metadata=config(field_name="searchResult3")
     )
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Response":
+        """
+        Decode a ``subsonic-response`` envelope. Every endpoint only populates one or
+        two of the fields, so only the keys present in the envelope are decoded.
+        """
+        kwargs = {}
+        for key in data.keys() & _RESPONSE_KEYS.keys():
+            name, decode = _RESPONSE_KEYS[key]
+            value = data[key]
+            kwargs[name] = None if value is None else decode(value)
+        return cls(**kwargs)
+
+
+# The key of each field in the subsonic-response envelope, mapped to the field name and
+# the function that decodes it. This is derived from the field metadata of Response so
+# that the two cannot get out of sync.
+def _response_keys() -> Dict[str, Tuple[str, Callable[[Any], Any]]]:
+    keys = {}
+    for f in fields(Response):
+        overrides = f.metadata.get("dataclasses_json", {})
+        key = overrides["letter_case"](f.name) if "letter_case" in overrides else f.name
+        # All of the fields are Optional[...], so the first argument is the nested type.
+        decode = overrides.get("decoder") or get_args(f.type)[0].from_dict
+        keys[key] = (f.name, decode)
+    return keys
+
+
+_RESPONSE_KEYS = _response_keys()
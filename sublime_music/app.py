@@ -46,8 +46,6 @@ from .adapters.api_objects import Playlist, PlayQueue, Song
 from .config import AppConfiguration, ProviderConfiguration
 from .dbus import DBusManager, dbus_propagate
 from .players import PlayerDeviceEvent, PlayerEvent, PlayerManager
-from .ui.configure_provider import ConfigureProviderDialog
-from .ui.main import MainWindow
 from .ui.state import RepeatType, UIState
 from .util import resolve_path
 
@@ -61,6 +59,7 @@ class SublimeMusicApp(Gtk.Application):
         self.window: Optional[Gtk.Window] = None
         self.app_config = AppConfiguration.load_from_file(config_file)
         self.dbus_manager: Optional[DBusManager] = None
+        self._save_timeout_id: Optional[int] = None
 
         self.connect("shutdown", self.on_app_shutdown)
 
@@ -124,9 +123,6 @@ class SublimeMusicApp(Gtk.Application):
             self.window.present()
             return
 
-        # Load the state for the server, if it exists.
-        self.app_config.load_state()
-
         # If there is no current provider, use the first one if there are any
         # configured, and if none are configured, then show the dialog to create a new
         # one.
@@ -152,21 +148,30 @@ class SublimeMusicApp(Gtk.Application):
         for icon_dir in icon_dirs:
             default_icon_theme.append_search_path(str(icon_dir))
 
+        # The main window pulls in all of the UI modules, so it is only imported once a
+        # window is actually needed. This keeps it off the path of, for example, a second
+        # invocation that just hands off to the running instance.
+        from .ui.main import MainWindow
+
         # Windows are associated with the application when the last one is
         # closed the application shuts down.
         self.window = MainWindow(application=self, title="Sublime Music")
 
-        # Configure the CSS provider so that we can style elements on the
-        # window.
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_path(str(resolve_path("ui/app_styles.css")))
-        context = Gtk.StyleContext()
-        screen = Gdk.Screen.get_default()
-        context.add_provider_for_screen(screen, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_USER)
-
         self.window.show_all()
         self.window.present()
 
+        # Configure the CSS provider so that we can style elements on the window. This
+        # is done once the window has been presented so that parsing the CSS is not on
+        # the critical path to the first paint. The styles apply on the next redraw.
+        def load_css():
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_path(str(resolve_path("ui/app_styles.css")))
+            context = Gtk.StyleContext()
+            screen = Gdk.Screen.get_default()
+            context.add_provider_for_screen(screen, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_USER)
+
+        GLib.idle_add(load_css)
+
         # Connect after we know there's a server configured.
         self.window.stack.connect("notify::visible-child", self.on_stack_change)
         self.window.connect("song-clicked", self.on_song_clicked)
@@ -547,7 +552,7 @@ class SublimeMusicApp(Gtk.Application):
                 AdapterManager.on_offline_mode_change(offline_mode)
 
             del state_updates["__settings__"]
-            self.app_config.save()
+            self._schedule_save()
 
         if player_setting := state_updates.get("__player_setting__"):
             player_name, option_name, value = player_setting
@@ -555,7 +560,7 @@ class SublimeMusicApp(Gtk.Application):
             del state_updates["__player_setting__"]
             if pm := self.player_manager:
                 pm.change_settings(self.app_config.player_config)
-            self.app_config.save()
+            self._schedule_save()
 
         for k, v in state_updates.items():
             setattr(self.app_config.state, k, v)
@@ -985,17 +990,37 @@ class SublimeMusicApp(Gtk.Application):
             self.player_manager.pause()
             self.player_manager.shutdown()
 
+        if self._save_timeout_id is not None:
+            GLib.source_remove(self._save_timeout_id)
+            self._save_timeout_id = None
         self.app_config.save()
         if self.dbus_manager:
             self.dbus_manager.shutdown()
         AdapterManager.shutdown()
 
     # ########## HELPER METHODS ########## #
+    def _schedule_save(self):
+        """
+        Save the configuration shortly. Settings changes tend to come in bursts (for
+        example, while a spin button is held down), so this batches them into a single
+        write instead of rewriting the config file on every change.
+        """
+        if self._save_timeout_id is None:
+            self._save_timeout_id = GLib.timeout_add(250, self._flush_save)
+
+    def _flush_save(self) -> bool:
+        self._save_timeout_id = None
+        self.app_config.save()
+        return False
+
     def show_configure_servers_dialog(
         self,
         provider_config: ProviderConfiguration | None = None,
     ):
         """Show the Connect to Server dialog."""
+        # This dialog is rarely shown, so only import it when it is needed.
+        from .ui.configure_provider import ConfigureProviderDialog
+
         dialog = ConfigureProviderDialog(self.window, provider_config)
         result = dialog.run()
         if result == Gtk.ResponseType.APPLY:
@@ -1,8 +1,6 @@
 import threading
 from datetime import timedelta
-from typing import Callable, Dict, Optional, Tuple, Type, Union, cast
-
-import mpv
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union, cast
 
 from ..adapters.api_objects import Song
 from .base import Player, PlayerDeviceEvent, PlayerEvent
@@ -23,6 +21,8 @@ class MPVPlayer(Player):
 
     _volume = 100.0
     _muted = False
+    _mpv: Any = None
+    _mpv_lock = threading.Lock()
 
     _is_mock = False
 
@@ -41,34 +41,11 @@ class MPVPlayer(Player):
         player_device_change_callback: Callable[[PlayerDeviceEvent], None],
         config: Dict[str, Union[str, int, bool]],
     ):
-        self.mpv = mpv.MPV()
-        if MPVPlayer._is_mock:
-            self.mpv.audio_device = "null"
-        self.mpv.audio_client_name = "sublime-music"
+        self.on_timepos_change = on_timepos_change
+        self.on_track_end = on_track_end
+        self.on_player_event = on_player_event
         self.change_settings(config)
 
-        @self.mpv.property_observer("time-pos")
-        def time_observer(_, value: Optional[float]):
-            on_timepos_change(value)
-            if value is None and self._progress_value_count > 1:
-                on_track_end()
-                with self._progress_value_lock:
-                    self._progress_value_count = 0
-
-            if value:
-                with self._progress_value_lock:
-                    self._progress_value_count += 1
-
-        @self.mpv.property_observer("demuxer-cache-time")
-        def cache_size_observer(_, value: Optional[float]):
-            on_player_event(
-                PlayerEvent(
-                    PlayerEvent.EventType.STREAM_CACHE_PROGRESS_CHANGE,
-                    "this device",
-                    stream_cache_duration=value,
-                )
-            )
-
         # Indicate to the UI that we exist.
         player_device_change_callback(
             PlayerDeviceEvent(
@@ -76,13 +53,68 @@ class MPVPlayer(Player):
             )
         )
 
+    @property
+    def mpv(self) -> Any:
+        """
+        The libmpv player. Loading libmpv and starting the player is slow, so it is
+        deferred until the player is actually used instead of happening on startup.
+        """
+        if self._mpv is not None:
+            return self._mpv
+
+        with self._mpv_lock:
+            # Another thread may have created the player while this one was waiting.
+            if self._mpv is not None:
+                return self._mpv
+
+            import mpv
+
+            # Only publish the player once it is fully configured, so that no caller
+            # ever sees a player without the observers (and if any of this raises, the
+            # next access tries again).
+            player = mpv.MPV()
+            if MPVPlayer._is_mock:
+                player.audio_device = "null"
+            player.audio_client_name = "sublime-music"
+            player.volume = 0 if self._muted else self._volume
+            self._apply_settings(player)
+
+            @player.property_observer("time-pos")
+            def time_observer(_, value: Optional[float]):
+                self.on_timepos_change(value)
+                if value is None and self._progress_value_count > 1:
+                    self.on_track_end()
+                    with self._progress_value_lock:
+                        self._progress_value_count = 0
+
+                if value:
+                    with self._progress_value_lock:
+                        self._progress_value_count += 1
+
+            @player.property_observer("demuxer-cache-time")
+            def cache_size_observer(_, value: Optional[float]):
+                self.on_player_event(
+                    PlayerEvent(
+                        PlayerEvent.EventType.STREAM_CACHE_PROGRESS_CHANGE,
+                        "this device",
+                        stream_cache_duration=value,
+                    )
+                )
+
+            self._mpv = player
+            return player
+
     def change_settings(self, config: Dict[str, Union[str, int, bool]]):
         self.config = config
-        self.mpv.replaygain = {
+        if self._mpv is not None:
+            self._apply_settings(self._mpv)
+
+    def _apply_settings(self, player: Any):
+        player.replaygain = {
             "Disabled": "no",
             "Track": "track",
             "Album": "album",
-        }.get(cast(str, config.get(REPLAY_GAIN_KEY, "Disabled")), "no")
+        }.get(cast(str, self.config.get(REPLAY_GAIN_KEY, "Disabled")), "no")
 
     def refresh_players(self):
         # Don't do anything
@@ -102,7 +134,7 @@ class MPVPlayer(Player):
 
     @property
     def playing(self) -> bool:
-        return not self.mpv.pause
+        return self._mpv is not None and not self._mpv.pause
 
     @property
     def gapless_playback(self) -> bool:
@@ -112,15 +144,16 @@ class MPVPlayer(Player):
         return self._volume
 
     def set_volume(self, volume: float):
-        if not self._muted:
-            self.mpv.volume = volume
+        if not self._muted and self._mpv is not None:
+            self._mpv.volume = volume
         self._volume = volume
 
     def get_is_muted(self) -> bool:
         return self._muted
 
     def set_muted(self, muted: bool):
-        self.mpv.volume = 0 if muted else self._volume
+        if self._mpv is not None:
+            self._mpv.volume = 0 if muted else self._volume
         self._muted = muted
 
     def play_media(self, uri: str, progress: timedelta, song: Song):
@@ -141,7 +174,8 @@ class MPVPlayer(Player):
         self.song_loaded = True
 
     def pause(self):
-        self.mpv.pause = True
+        if self._mpv is not None:
+            self._mpv.pause = True
 
     def play(self):
         self.mpv.pause = False
@@ -753,7 +753,10 @@ class PlayerControls(Gtk.ActionBar):
         selection.set_select_function(lambda _, model, path, current: model[path[0]][0])
 
         # Album Art column. This function defines what image to use for the play queue
-        # song icon.
+        # song icon. The play icon overlay is the same for every row, so it is read from
+        # disk the first time that it is needed rather than on every render.
+        play_overlay_pixbuf: Optional[GdkPixbuf.Pixbuf] = None
+
         def filename_to_pixbuf(
             column: Any,
             cell: Gtk.CellRendererPixbuf,
@@ -761,6 +764,7 @@ class PlayerControls(Gtk.ActionBar):
             tree_iter: Gtk.TreeIter,
             flags: Any,
         ):
+            nonlocal play_overlay_pixbuf
             cell.set_property("sensitive", model.get_value(tree_iter, 0))
             filename = model.get_value(tree_iter, 1)
             if not filename:
@@ -771,9 +775,10 @@ class PlayerControls(Gtk.ActionBar):
 
             # If this is the playing song, then overlay the play icon.
             if model.get_value(tree_iter, 3):
-                play_overlay_pixbuf = GdkPixbuf.Pixbuf.new_from_file(
-                    str(resolve_path("ui/images/play-queue-play.png"))
-                )
+                if play_overlay_pixbuf is None:
+                    play_overlay_pixbuf = GdkPixbuf.Pixbuf.new_from_file(
+                        str(resolve_path("ui/images/play-queue-play.png"))
+                    )
 
                 play_overlay_pixbuf.composite(
                     pixbuf, 0, 0, 50, 50, 0, 0, 1, 1, GdkPixbuf.InterpType.NEAREST, 200
@@ -465,6 +465,19 @@ def test_get_play_queue(adapter: SubsonicAdapter):
         assert song.genre and song.genre.name == "Classical"
 
 
+def test_get_play_queue_missing_current(adapter: SubsonicAdapter):
+    for filename, data in mock_data_files("get_play_queue_missing_current"):
+        logging.info(filename)
+        logging.debug(data)
+        adapter._set_mock_data(data)
+
+        # The current song is not in the queue, so there is no current index.
+        play_queue = adapter.get_play_queue()
+        assert play_queue
+        assert play_queue.current_index is None
+        assert play_queue.songs and len(play_queue.songs) == 2
+
+
 def test_get_album(adapter: SubsonicAdapter):
     for filename, data in mock_data_files("get_album"):
         logging.info(filename)
@@ -556,3 +569,44 @@ def test_search(adapter: SubsonicAdapter):
         assert len(search_results._songs) == 7
         assert len(search_results._artists) == 2
         assert len(search_results._albums) == 4
+
+
+def test_response_from_api():
+    # Keys that are not Response fields (including the envelope metadata) are ignored,
+    # and fields that the server sends as null are left unset.
+    response = SubsonicAPI.Response.from_api(
+        {
+            "status": "ok",
+            "version": "1.16.1",
+            "openSubsonic": True,
+            "notAField": {"foo": "bar"},
+            "album": None,
+            "genres": {"genre": [{"value": "Rock", "songCount": 3, "albumCount": 1}]},
+            "playQueue": {"entry": [{"id": "1", "title": "Foo"}], "current": "1"},
+        }
+    )
+    assert response.album is None
+    assert response.genres == SubsonicAPI.Genres(
+        genre=[SubsonicAPI.Genre("Rock", song_count=3, album_count=1)]
+    )
+    assert response.play_queue is not None
+    assert [s.id for s in response.play_queue.songs] == ["1"]
+    assert response.play_queue.current_index == 0
+    assert response.song is None
+    assert response.search_result is None
+
+
+def test_song_from_api():
+    # Songs in directories have both a title and a name. The title is preferred.
+    song = SubsonicAPI.Song.from_api({"id": 1, "title": "Title", "name": "file.mp3"})
+    assert song.id == "1"
+    assert song.title == "Title"
+
+    # Some servers only send the name.
+    song = SubsonicAPI.Song.from_api({"id": "2", "name": "Name"})
+    assert song.title == "Name"
+
+
+def test_album_from_api_null_songs():
+    album = SubsonicAPI.Album.from_api({"id": "1", "name": "Foo", "song": None})
+    assert album.songs == []
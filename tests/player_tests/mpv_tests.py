@@ -1,5 +1,8 @@
+import sys
 from datetime import timedelta
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
 
 from sublime_music.adapters.api_objects import Song
 from sublime_music.players.mpv import MPVPlayer
@@ -15,6 +18,41 @@ def test_init():
     MPVPlayer(empty_fn, empty_fn, empty_fn, empty_fn, {"Replay Gain": "Disabled"})
 
 
+class FakeMPV:
+    def __init__(self):
+        self.observers: Dict[str, Callable[..., Any]] = {}
+
+    def property_observer(self, name: str) -> Callable[..., Any]:
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            self.observers[name] = fn
+            return fn
+
+        return decorator
+
+
+def test_settings_applied_on_player_creation(monkeypatch: Any):
+    # The libmpv player is only created on first use, so anything set before then has
+    # to be applied when it is created.
+    monkeypatch.setitem(sys.modules, "mpv", SimpleNamespace(MPV=FakeMPV))
+    empty_fn = lambda *_, **__: None
+    mpv_player = MPVPlayer(empty_fn, empty_fn, empty_fn, empty_fn, {"Replay Gain": "Disabled"})
+
+    mpv_player.set_volume(70)
+    mpv_player.set_muted(True)
+    mpv_player.change_settings({"Replay Gain": "Album"})
+    assert mpv_player._mpv is None
+    assert not mpv_player.playing
+
+    player = mpv_player.mpv
+    assert mpv_player.mpv is player
+    assert player.volume == 0
+    assert player.replaygain == "album"
+    assert set(player.observers) == {"time-pos", "demuxer-cache-time"}
+
+    mpv_player.set_muted(False)
+    assert player.volume == 70
+
+
 def is_close(expected: float, value: float, delta: float = 0.5) -> bool:
     print(f"EXPECTED: {expected}, VALUE: {value}")  # noqa: T201
     return abs(value - expected) < delta